@@ -0,0 +1,17 @@
+import os
+
+# Each /execute request spends nearly all of its wall time blocked in
+# subprocess.run, so the workload is I/O-bound: gthread workers with a
+# generous thread count scale concurrency roughly linearly until the CPU
+# saturates.
+workers = len(os.sched_getaffinity(0)) * 2
+threads = 16
+worker_class = "gthread"
+
+# Scripts may run up to SCRIPT_TIMEOUT seconds; give the worker a little
+# headroom on top so gunicorn doesn't kill it mid-request.
+SCRIPT_TIMEOUT = int(os.environ.get("SCRIPT_TIMEOUT", "10"))
+timeout = SCRIPT_TIMEOUT + 5
+keepalive = 5
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
@@ -1,13 +1,47 @@
 import ast
 import os
+import re
+import sys
 import json
+import base64
+import hashlib
+import marshal
+import queue
+import select
 import subprocess
+import tempfile
+import threading
+import time
+import unicodedata
 import logging
+from functools import lru_cache
 from typing import Tuple, Optional, Any
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from flask_orjson import OrjsonProvider
+except ImportError:
+    OrjsonProvider = None
+
+# orjson works straight on bytes for the child's result frame and the
+# precomputed endpoint bodies; stdlib json is the fallback when it isn't
+# installed.
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
 # Configure logging for production
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -15,15 +49,59 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
+if OrjsonProvider is not None:
+    # orjson handles both request parsing and response serialization; it is
+    # considerably faster than the stdlib json module on large script/result
+    # payloads and produces compact, unsorted output by default.
+    app.json = OrjsonProvider(app)
+else:
+    # Stdlib fallback: turn off key sorting (user result dicts shouldn't be
+    # reordered anyway) and pretty-printing to match orjson's output.
+    app.json.sort_keys = False
+    app.json.compact = True
 CORS(app)
 
 NSJAIL_CONFIG_PATH = "/etc/nsjail.cfg"
 IS_CLOUD = os.environ.get("BUILD") == "cloud"
 SCRIPT_TIMEOUT = int(os.environ.get("SCRIPT_TIMEOUT", "10"))
 MAX_SCRIPT_SIZE = int(os.environ.get("MAX_SCRIPT_SIZE", "10000"))  # 10KB max
+WARM_INTERPRETERS = int(os.environ.get("WARM_INTERPRETERS", "4"))
+
+# Reject oversized bodies at the WSGI layer (as a 413, which is already
+# handled below) instead of reading and JSON-parsing a huge payload only for
+# validate_script to refuse it. The slack covers the JSON envelope around
+# the script itself.
+app.config["MAX_CONTENT_LENGTH"] = MAX_SCRIPT_SIZE + 4096
+
+# Modules and builtins scripts are not allowed to touch. Checked against the
+# parsed AST rather than the raw text, so "open(" inside a string literal is
+# fine while an actual import/call is not.
+BANNED_MODULES = frozenset({"os", "sys", "subprocess", "shutil"})
+BANNED_CALLS = frozenset(
+    {
+        "__import__",
+        "eval",
+        "exec",
+        "compile",
+        "open",
+        "file",
+        "input",
+        "raw_input",
+        "exit",
+        "quit",
+        "reload",
+    }
+)
 
-# SCRIPT_PATH = "/sandbox/tmp/script.py" if IS_CLOUD else "/tmp/script.py"
-SCRIPT_PATH = "/sandbox/tmp/script.py"
+# All banned names folded into one compiled alternation: a single C-level
+# scan over the source instead of one pass per pattern. Used purely as a
+# prescreen over the NFKC-normalized source — Python normalizes identifiers
+# the same way (PEP 3131), so if no banned identifier appears in the
+# normalized text, the AST walk below cannot flag anything either and clean
+# scripts skip it.
+_BANNED_TOKEN_RE = re.compile(
+    r"\b(?:%s)\b" % "|".join(map(re.escape, sorted(BANNED_MODULES | BANNED_CALLS)))
+)
 
 
 def validate_script(script_content: str) -> Tuple[bool, Optional[str]]:
@@ -34,100 +112,293 @@ def validate_script(script_content: str) -> Tuple[bool, Optional[str]]:
     if len(script_content) > MAX_SCRIPT_SIZE:
         return False, f"Script too large. Maximum size is {MAX_SCRIPT_SIZE} characters."
 
-    dangerous_patterns = [
-        "import os",
-        "import sys",
-        "import subprocess",
-        "import shutil",
-        "__import__",
-        "eval(",
-        "exec(",
-        "compile(",
-        "open(",
-        "file(",
-        "input(",
-        "raw_input(",
-        "exit(",
-        "quit(",
-        "reload(",
-    ]
-
-    for pattern in dangerous_patterns:
-        if pattern in script_content:
-            return False, f"Dangerous operation detected: {pattern}"
+    is_valid, error_message, _ = _validate_cached(script_content)
+    return is_valid, error_message
 
+
+@lru_cache(maxsize=512)
+def _validate_cached(
+    script_content: str,
+) -> Tuple[bool, Optional[str], Optional[ast.Module]]:
+    """
+    Pattern scan and parse of the script body, returning the parsed tree so
+    compilation can reuse it instead of parsing a second time. Cached so
+    repeated submissions of an identical script (a common pattern with
+    retries and polling clients) skip the parse entirely.
+    """
     try:
-        tree = ast.parse(script_content)
+        tree = ast.parse(
+            script_content,
+            type_comments=False,
+            feature_version=sys.version_info[:2],
+        )
     except SyntaxError as e:
-        return False, f"Syntax error in script: {str(e)}"
+        return False, f"Syntax error in script: {str(e)}", None
+
+    # One walk over the structured tree replaces the old list of substring
+    # scans, and it can't be fooled by banned names inside string literals.
+    # Only needed when the prescreen saw a banned identifier somewhere; the
+    # prescreen runs on NFKC-normalized text so confusable spellings like
+    # "import 𝗈𝗌" can't slip past it (the parser normalizes identifiers
+    # to exactly the same form).
+    if _BANNED_TOKEN_RE.search(unicodedata.normalize("NFKC", script_content)):
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.name.split(".")[0] in BANNED_MODULES:
+                        return (
+                            False,
+                            f"Dangerous operation detected: import {alias.name}",
+                            None,
+                        )
+            elif isinstance(node, ast.ImportFrom):
+                if node.module and node.module.split(".")[0] in BANNED_MODULES:
+                    return (
+                        False,
+                        f"Dangerous operation detected: import {node.module}",
+                        None,
+                    )
+            elif isinstance(node, ast.Call):
+                if isinstance(node.func, ast.Name) and node.func.id in BANNED_CALLS:
+                    return (
+                        False,
+                        f"Dangerous operation detected: {node.func.id}(",
+                        None,
+                    )
 
-    has_main = False
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef) and node.name == "main":
-            has_main = True
-            break
+    # Only a module-level main() is callable by the wrapper, so scanning
+    # tree.body is enough — no need to walk the whole tree.
+    has_main = any(
+        isinstance(node, ast.FunctionDef) and node.name == "main"
+        for node in tree.body
+    )
 
     if not has_main:
-        return False, "Script must contain a main() function"
+        return False, "Script must contain a main() function", None
 
-    return True, None
+    return True, None, tree
 
 
-def execute_script_safely(
-    script_content: str,
-) -> Tuple[Optional[Any], str, Optional[str]]:
-    """
-    Execute the script safely using nsjail and return the result and stdout.
-    Returns (result, stdout, error_message)
-    """
-    script_path = SCRIPT_PATH
-
-    try:
-        wrapper_script = f"""
+# The wrapper around the user script is identical for every request apart
+# from the script itself, so keep the constant halves as prebuilt bytes and
+# join them with the (encoded) script instead of rebuilding the whole thing
+# with an f-string per request.
+_WRAPPER_PROLOGUE = b"""
 import sys
 import json
 import io
+import base64
+import marshal
 from contextlib import redirect_stdout
 
-# Original script
-{script_content}
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+
+except ImportError:
+
+    def _dumps(value):
+        return json.dumps(value).encode()
+
+# Original script, precompiled by the parent
+"""
+
+# The wrapper reports back with length-prefixed frames (b"S<len>\\n<payload>")
+# written straight to the stdout fd: S carries the captured stdout, R the
+# JSON-encoded result, E an error message. The parent decodes them in one
+# pass without any sentinel-string searching.
+_WRAPPER_EPILOGUE = b"""
 
 # Execution wrapper
 if __name__ == "__main__":
+    out = sys.stdout.buffer
     try:
-        # capture stdout
+        # capture stdout; the user module is exec'd under the same redirect
+        # so module-level prints can't land ahead of the first frame
         stdout_capture = io.StringIO()
-        
+
         with redirect_stdout(stdout_capture):
+            exec(marshal.loads(_USER_CODE), globals())
             result = main()
-            
-        # capture stdout
-        captured_stdout = stdout_capture.getvalue()
-        
-        # print result in structured way
-        print("__STDOUT_START__")
-        print(captured_stdout, end="")
-        print("__STDOUT_END__")
-        
-        print("__RESULT_START__")
-        print(json.dumps(result))
-        print("__RESULT_END__")
-        
+
+        captured_stdout = stdout_capture.getvalue().encode()
+        result_json = _dumps(result)
+
+        out.write(b"S%d\\n" % len(captured_stdout))
+        out.write(captured_stdout)
+        out.write(b"R%d\\n" % len(result_json))
+        out.write(result_json)
+        out.flush()
+
     except Exception as e:
-        print("__ERROR_START__")
-        print(f"Error in main() function: {{str(e)}}")
-        print("__ERROR_END__")
+        message = f"Error in main() function: {e}".encode()
+        out.write(b"E%d\\n" % len(message))
+        out.write(message)
+        out.flush()
 """
-        script_dir = os.path.dirname(script_path)
-        if not os.path.exists(script_dir):
-            os.makedirs(script_dir, mode=0o777, exist_ok=True)
 
-        with open(script_path, "w") as f:
-            f.write(wrapper_script)
 
-        # Execute script based on environment
+def _parse_frames(output: bytes) -> dict:
+    """
+    Decode the wrapper's length-prefixed frames in a single pass.
+    Returns a dict mapping the frame tag (b"S", b"R" or b"E") to its payload.
+    Raises ValueError if the output doesn't follow the framing protocol.
+    """
+    frames = {}
+    pos = 0
+    end = len(output)
+    while pos < end:
+        tag = output[pos : pos + 1]
+        newline = output.find(b"\n", pos + 1)
+        if tag not in (b"S", b"R", b"E") or newline < 0:
+            raise ValueError(f"malformed frame at offset {pos}")
+        length = int(output[pos + 1 : newline])
+        payload = output[newline + 1 : newline + 1 + length]
+        if len(payload) != length:
+            raise ValueError(f"truncated {tag!r} frame")
+        frames[tag] = payload
+        pos = newline + 1 + length
+    return frames
+
+
+@lru_cache(maxsize=512)
+def _compile_script(script_content: str) -> bytes:
+    """
+    Compile the user script to bytecode once in the parent and marshal it,
+    base64-encoded for embedding in the wrapper. The sandboxed interpreter
+    then skips lexing and parsing entirely, and repeated submissions of an
+    identical script skip compilation here too. Requires the sandbox python
+    to be the same version as the parent (the image ships a single
+    interpreter), since marshal's format is version-specific.
+
+    Compiles from the AST that validation already built (a cache hit on
+    _validate_cached) rather than re-parsing the source text.
+    """
+    _, _, tree = _validate_cached(script_content)
+    code = compile(tree, "<user_script>", "exec")
+    return base64.b64encode(marshal.dumps(code))
+
+
+def _spawn_child(cmd, wrapper_script=None):
+    """
+    Launch one interpreter child with its stderr on an unlinked temp file.
+    When wrapper_script is given it is delivered through an anonymous memfd
+    used as stdin (written in full before the child runs); otherwise stdin
+    stays a pipe for the caller to feed later. Returns (proc, stderr_tmp).
+    """
+    stderr_tmp = tempfile.TemporaryFile()
+    try:
+        if wrapper_script is None:
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=stderr_tmp,
+                bufsize=65536,
+            )
+        else:
+            memfd = os.memfd_create("wrapper", os.MFD_CLOEXEC)
+            try:
+                os.write(memfd, wrapper_script)
+                os.lseek(memfd, 0, os.SEEK_SET)
+                proc = subprocess.Popen(
+                    cmd,
+                    stdin=memfd,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_tmp,
+                    bufsize=65536,
+                )
+            finally:
+                os.close(memfd)
+    except Exception:
+        stderr_tmp.close()
+        raise
+    return proc, stderr_tmp
+
+
+class _WarmInterpreterPool:
+    """
+    Keeps a handful of 'python3 -' children pre-spawned so a request doesn't
+    pay interpreter startup: the child has already initialized the VM and is
+    parked reading stdin when the wrapper arrives. Each child still runs
+    exactly one script and exits, so the process-per-script boundary is
+    unchanged. Children are spawned lazily on first use (gunicorn workers
+    each get their own pool) and replenished in the background after every
+    acquire.
+
+    Cloud mode can't use this: nsjail's time_limit starts ticking at spawn,
+    so a jail parked waiting for work would be killed while idle.
+    """
+
+    def __init__(self, cmd, size):
+        self._cmd = cmd
+        self._size = size
+        self._queue = queue.Queue(maxsize=size)
+        self._lock = threading.Lock()
+        self._started = False
+
+    def _fill(self):
+        if self._queue.full():
+            return
+        child = _spawn_child(self._cmd)
+        try:
+            self._queue.put_nowait(child)
+        except queue.Full:
+            proc, stderr_tmp = child
+            proc.kill()
+            proc.wait()
+            stderr_tmp.close()
+
+    def acquire(self):
+        """Return a (proc, stderr_tmp) pair, warm if one is available."""
+        with self._lock:
+            if not self._started:
+                self._started = True
+                for _ in range(self._size):
+                    self._fill()
+
+        try:
+            proc, stderr_tmp = self._queue.get_nowait()
+        except queue.Empty:
+            return _spawn_child(self._cmd)
+
+        threading.Thread(target=self._fill, daemon=True).start()
+
+        if proc.poll() is not None:
+            # Died while parked; fall back to a cold spawn.
+            stderr_tmp.close()
+            return _spawn_child(self._cmd)
+        return proc, stderr_tmp
+
+
+_warm_pool = _WarmInterpreterPool(["python3", "-"], WARM_INTERPRETERS)
+
+
+def execute_script_safely(
+    script_content: str,
+) -> Tuple[Optional[Any], str, Optional[str]]:
+    """
+    Execute the script safely using nsjail and return the result and stdout.
+    Returns (result, stdout, error_message)
+    """
+    try:
+        wrapper_script = b"".join(
+            (
+                _WRAPPER_PROLOGUE,
+                b'_USER_CODE = base64.b64decode(b"',
+                _compile_script(script_content),
+                b'")',
+                _WRAPPER_EPILOGUE,
+            )
+        )
+        # Pipe the wrapper to the interpreter via stdin: no per-request file
+        # on disk, and no shared path for concurrent requests to clobber.
         if IS_CLOUD:
-            # Use nsjail with config and pass python command explicitly
+            # Use nsjail with config and pass python command explicitly.
+            # Cloud children are spawned per request — the jail is the
+            # isolation boundary and its time_limit starts ticking at spawn,
+            # so they can't be pre-warmed.
             cmd = [
                 "nsjail",
                 "--config",
@@ -136,64 +407,105 @@ if __name__ == "__main__":
                 "/sandbox",
                 "--",
                 "/usr/local/bin/python3",
-                "/tmp/script.py",
+                "-",
             ]
             logger.info("Executing script with nsjail in cloud environment")
+            proc, stderr_tmp = _spawn_child(cmd, wrapper_script)
         else:
-            cmd = ["python3", script_path]
-
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=SCRIPT_TIMEOUT
-        )
+            # Locally, take a pre-warmed interpreter (VM already initialized,
+            # parked reading stdin) and feed it the wrapper.
+            cmd = ["python3", "-"]
+            proc, stderr_tmp = _warm_pool.acquire()
+            try:
+                proc.stdin.write(wrapper_script)
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
 
-        if result.returncode != 0:
+        # Stream the child's stdout through a pipe in fixed-size chunks so
+        # the parent can enforce its own deadline while reading, instead of
+        # sitting blind until the child exits. stderr goes to an unlinked
+        # temp file so only one pipe needs draining.
+        try:
+            try:
+                deadline = time.monotonic() + SCRIPT_TIMEOUT
+                chunks = []
+                # Read the raw fd non-blocking: a buffered read(65536) would
+                # loop inside read() until it had a full chunk or EOF, so a
+                # child that flushes a little output and keeps running could
+                # block the worker past the deadline (and buffered bytes
+                # would make a later select() lie about readiness).
+                stdout_fd = proc.stdout.fileno()
+                os.set_blocking(stdout_fd, False)
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise subprocess.TimeoutExpired(cmd, SCRIPT_TIMEOUT)
+                    ready, _, _ = select.select([stdout_fd], [], [], remaining)
+                    if not ready:
+                        continue
+                    try:
+                        chunk = os.read(stdout_fd, 65536)
+                    except BlockingIOError:
+                        continue
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+
+                returncode = proc.wait(timeout=max(deadline - time.monotonic(), 0))
+            except Exception:
+                proc.kill()
+                proc.wait()
+                raise
+
+            output = b"".join(chunks)
+            stderr_tmp.seek(0)
+            stderr_text = stderr_tmp.read().decode("utf-8", errors="replace")
+        finally:
+            stderr_tmp.close()
+
+        if returncode != 0:
             logger.warning(
-                f"Script execution failed with return code {result.returncode}: {result.stderr}"
+                f"Script execution failed with return code {returncode}: {stderr_text}"
             )
-            return None, result.stderr, f"Script execution failed: {result.stderr}"
-
-        output = result.stdout
+            return None, stderr_text, f"Script execution failed: {stderr_text}"
 
         try:
-            if "__STDOUT_START__" in output and "__STDOUT_END__" in output:
-                index_start = output.find("__STDOUT_START__") + len(
-                    "__STDOUT_START__\n"
-                )
-                index_end = output.find("__STDOUT_END__")
-                captured_stdout = output[index_start:index_end].rstrip("\n")
-            else:
-                captured_stdout = ""
+            frames = _parse_frames(output)
 
-            if "__RESULT_START__" in output and "__RESULT_END__" in output:
-                index_start = output.find("__RESULT_START__") + len(
-                    "__RESULT_START__\n"
-                )
-                index_end = output.find("__RESULT_END__")
-                result_json = output[index_start:index_end].strip()
+            captured_stdout = (
+                frames.get(b"S", b"").decode("utf-8", errors="replace").rstrip("\n")
+            )
 
+            if b"R" in frames:
+                result_json = frames[b"R"]
                 try:
-                    result_data = json.loads(result_json)
+                    result_data = _loads(result_json)
                     return result_data, captured_stdout, None
-                except json.JSONDecodeError:
+                except ValueError:
                     return (
                         None,
                         captured_stdout,
-                        f"main() function must return a JSON-serializable value. Got: {result_json}",
+                        f"main() function must return a JSON-serializable value. Got: {result_json.decode('utf-8', errors='replace')}",
                     )
 
-            elif "__ERROR_START__" in output and "__ERROR_END__" in output:
-                index_start = output.find("__ERROR_START__") + len("__ERROR_START__\n")
-                index_end = output.find("__ERROR_END__")
-                error_message = output[index_start:index_end].strip()
+            elif b"E" in frames:
+                error_message = frames[b"E"].decode("utf-8", errors="replace")
                 return None, captured_stdout, error_message
 
             else:
                 return (
                     None,
                     captured_stdout,
-                    f"Could not parse script output. Output: {output}",
+                    f"Could not parse script output. Output: {output.decode('utf-8', errors='replace')}",
                 )
 
+        except ValueError:
+            return (
+                None,
+                "",
+                f"Could not parse script output. Output: {output.decode('utf-8', errors='replace')}",
+            )
         except Exception as e:
             logger.error(f"Error parsing script output: {str(e)}")
             return None, "", f"Error parsing script output: {str(e)}"
@@ -203,12 +515,6 @@ if __name__ == "__main__":
     except Exception as e:
         logger.error(f"Unexpected error during script execution: {str(e)}")
         return None, "", f"Unexpected error: {str(e)}"
-    finally:
-        if os.path.exists(script_path):
-            try:
-                os.remove(script_path)
-            except:
-                pass
 
 
 @app.route("/execute", methods=["POST"])
@@ -231,6 +537,14 @@ def execute():
         if not request.is_json:
             return jsonify({"error": "Request must be JSON"}), 400
 
+        # Belt and braces alongside MAX_CONTENT_LENGTH: a declared oversized
+        # body is rejected before the JSON parse ever runs.
+        if (
+            request.content_length
+            and request.content_length > app.config["MAX_CONTENT_LENGTH"]
+        ):
+            return jsonify({"error": "Request too large"}), 413
+
         data = request.get_json()
 
         if "script" not in data:
@@ -259,54 +573,76 @@ def execute():
         return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
 
+# /health and / return the same payload on every call, so serialize them
+# once at import time and answer conditional requests with a 304 instead of
+# re-encoding the dict for every poll.
+_HEALTH_BODY = _dumps(
+    {
+        "status": "healthy",
+        "service": "Python Code Execution API",
+        "environment": "cloud" if IS_CLOUD else "local",
+        "version": "1.0.0",
+        "nsjail_enabled": IS_CLOUD,
+    }
+)
+
+_ROOT_BODY = _dumps(
+    {
+        "message": "Python Code Execution API",
+        "description": "Execute arbitrary Python scripts safely",
+        "version": "1.0.0",
+        "environment": "cloud" if IS_CLOUD else "local",
+        "endpoints": {
+            "/": "GET - API information",
+            "/execute": "POST - Execute Python script with main() function",
+            "/health": "GET - Health check",
+        },
+        "usage": {
+            "method": "POST",
+            "url": "/execute",
+            "content_type": "application/json",
+            "body": {"script": "def main(): return {'message': 'Hello World'}"},
+        },
+        "limits": {
+            "max_script_size": MAX_SCRIPT_SIZE,
+            "execution_timeout": SCRIPT_TIMEOUT,
+            "allowed_libraries": [
+                "pandas",
+                "numpy",
+                "json",
+                "math",
+                "random",
+                "datetime",
+            ],
+        },
+    }
+)
+
+_HEALTH_ETAG = f'"{hashlib.blake2b(_HEALTH_BODY, digest_size=8).hexdigest()}"'
+_ROOT_ETAG = f'"{hashlib.blake2b(_ROOT_BODY, digest_size=8).hexdigest()}"'
+
+
+def _cached_json_response(body: bytes, etag: str) -> Response:
+    """Serve a precomputed JSON body, honoring If-None-Match with a 304."""
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status=304, headers={"ETag": etag})
+    return Response(
+        body,
+        mimetype="application/json",
+        headers={"ETag": etag, "Cache-Control": "public, max-age=5"},
+    )
+
+
 @app.route("/health", methods=["GET"])
 def health():
     """Health check endpoint for monitoring."""
-    return jsonify(
-        {
-            "status": "healthy",
-            "service": "Python Code Execution API",
-            "environment": "cloud" if IS_CLOUD else "local",
-            "version": "1.0.0",
-            "nsjail_enabled": IS_CLOUD,
-        }
-    )
+    return _cached_json_response(_HEALTH_BODY, _HEALTH_ETAG)
 
 
 @app.route("/", methods=["GET"])
 def root():
     """Root endpoint with API information."""
-    return jsonify(
-        {
-            "message": "Python Code Execution API",
-            "description": "Execute arbitrary Python scripts safely",
-            "version": "1.0.0",
-            "environment": "cloud" if IS_CLOUD else "local",
-            "endpoints": {
-                "/": "GET - API information",
-                "/execute": "POST - Execute Python script with main() function",
-                "/health": "GET - Health check",
-            },
-            "usage": {
-                "method": "POST",
-                "url": "/execute",
-                "content_type": "application/json",
-                "body": {"script": "def main(): return {'message': 'Hello World'}"},
-            },
-            "limits": {
-                "max_script_size": MAX_SCRIPT_SIZE,
-                "execution_timeout": SCRIPT_TIMEOUT,
-                "allowed_libraries": [
-                    "pandas",
-                    "numpy",
-                    "json",
-                    "math",
-                    "random",
-                    "datetime",
-                ],
-            },
-        }
-    )
+    return _cached_json_response(_ROOT_BODY, _ROOT_ETAG)
 
 
 @app.route("/debug", methods=["GET"])
@@ -316,7 +652,6 @@ def debug():
 
     debug_info = {
         "is_cloud": IS_CLOUD,
-        "script_path": SCRIPT_PATH,
         "nsjail_config": NSJAIL_CONFIG_PATH,
         "build_env": os.environ.get("BUILD"),
     }
@@ -359,11 +694,13 @@ if __name__ == "__main__":
 
     # Log environment detection
     if IS_CLOUD:
-        logger.info(f"Script path: {SCRIPT_PATH}")
         logger.info(f"nsjail config: {NSJAIL_CONFIG_PATH}")
         if os.path.exists(NSJAIL_CONFIG_PATH):
             logger.info("nsjail config file found")
         else:
             logger.warning("nsjail config file not found")
 
-    app.run(host="0.0.0.0", port=port, debug=debug_mode)
+    # Local development fallback only; production runs under gunicorn (see
+    # gunicorn_conf.py). threaded=True lets the dev server overlap requests
+    # that are blocked waiting on the script subprocess.
+    app.run(host="0.0.0.0", port=port, debug=debug_mode, threaded=True)